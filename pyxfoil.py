@@ -48,9 +48,13 @@ SOFTWARE.
 import os
 import sys
 import re
+import warnings
+import pathlib
+from functools import lru_cache
 import numpy as np
 import subprocess
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 
 ########################################################################
 ### GENERAL FILE AND PROCESS UTILITIES #################################
@@ -60,47 +64,47 @@ def MakeOutputDir(savedir):
     """make results output directory if it does not already exist.
     instring --> directory path from script containing folder
     """
-    #split individual directories
-    splitstring = savedir.split('/')
-    prestring = ''
-    for string in splitstring:
-        prestring += string + '/'
-        try:
-            os.mkdir(prestring)
-        except Exception:
-            pass
+    os.makedirs(savedir, exist_ok=True)
 
 def GetParentDir(savename):
     """Get parent directory from path of file"""
-    #split individual directories
-    splitstring = savename.split('/')
-    parent = ''
-    #concatenate all dirs except bottommost
-    for string in splitstring[:-1]:
-        parent += string + '/'
+    parent = os.path.dirname(savename)
+    #keep trailing slash (empty if file has no parent directory)
+    if parent and not parent.endswith('/'):
+        parent += '/'
     return parent
 
+@lru_cache(maxsize=128)
+def _FindBetweenPattern(before, after):
+    """Compile (and cache) search pattern used by 'FindBetween'"""
+    if after == None and before != None:
+        return re.compile('{}(?P<value>.*)$'.format(before))
+    else:
+        return re.compile('(?<={})(?P<value>.*?)(?={})'.format(before, after))
+
 def FindBetween(string, before='^', after=None):
     """Search 'string' for characters between 'before' and 'after' characters
     If after=None, return everything after 'before'
     Default before is beginning of line
     """
-    if after == None and before != None:
-        match = re.search('{}(.*)$'.format(before), string)
-        if match != None:
-            return match.group(1)
-        else:
-            return 'No Match'
+    match = _FindBetweenPattern(before, after).search(string)
+    if match != None:
+        return match.group('value')
     else:
-        match = re.search('(?<={})(?P<value>.*?)(?={})'.format(before, after), string)
-        if match != None:
-            return match.group('value')
-        else:
-            return 'No Match'
+        return 'No Match'
+
+#Operating system does not change during run, so only check it once
+_IS_WINDOWS = os.name == 'nt'
 
 def IsItWindows():
     """Return true if operating system is windows"""
-    return True if os.name == 'nt' else False
+    return _IS_WINDOWS
+
+def _AlfaArray(alfs):
+    """Angle of attack input must be array-like: return scalar or list of
+    alphas as 1D float array
+    """
+    return np.atleast_1d(np.asarray(alfs, dtype=float))
 
 def ErrorMessage(text):
     """Format an error output message
@@ -111,6 +115,33 @@ def ErrorMessage(text):
     "********************************************************************" \
     "\n\n".format(text)
 
+def GetXfoilPath(xfoilpath=None):
+    """Return path to xfoil executable for current operating system,
+    exiting with an error message if it is not installed.
+    xfoilpath --> manually specified path to xfoil (skips default location)
+    """
+    if xfoilpath != None:
+        #Manually specified path to Xfoil
+        pass
+    elif _IS_WINDOWS:
+        #Windows default location is in same folder as python script
+        xfoilpath = 'xfoil.exe'
+        #check dependencies
+        if not os.path.isfile(xfoilpath):
+            txt = "PYXFOIL ERROR: Put xfoil.exe in same folder as pyxfoil.py"
+            sys.exit(ErrorMessage(txt))
+    else:
+        #Mac Install location
+        xfoilpath = "/usr/local/bin/xfoil"
+        #check dependencies
+        if not os.path.isfile(xfoilpath):
+            txt = "PYXFOIL ERROR: Xfoil is not installed"
+            sys.exit(ErrorMessage(txt))
+        if not os.path.isfile('/opt/X11/bin/xquartz'):
+            txt = "PYXFOIL ERROR: X11/xquartz not installed"
+            print(ErrorMessage(txt))
+    return xfoilpath
+
 ########################################################################
 ### XFOIL AUTOMATION CLASS #############################################
 ########################################################################
@@ -131,27 +162,7 @@ class Xfoil:
         self.win = IsItWindows()
 
         #SET PATH TO XFOIL FOR CURRENT OPERATING SYSTEM
-        if xfoilpath != None:
-            #Manually specify path to Xfoil
-            self.xfoilpath = xfoilpath
-        elif self.win:
-            #Windows default location is in same folder as python script
-            self.xfoilpath = 'xfoil.exe'
-            #check dependencies
-            if not os.path.isfile(self.xfoilpath):
-                txt = "PYXFOIL ERROR: Put xfoil.exe in same folder as pyxfoil.py"
-                sys.exit(ErrorMessage(txt))
-        else:
-            #Mac Install location
-            self.xfoilpath = "/usr/local/bin/xfoil"
-            #check dependencies
-            if not os.path.isfile(self.xfoilpath):
-                txt = "PYXFOIL ERROR: Xfoil is not installed"
-                sys.exit(ErrorMessage(txt))
-            if not os.path.isfile('/opt/X11/bin/xquartz'):
-                txt = "PYXFOIL ERROR: X11/xquartz not installed"
-                print(ErrorMessage(txt))
-
+        self.xfoilpath = GetXfoilPath(xfoilpath)
 
         #SAVE RUN PARAMETERS
         #Reynolds number
@@ -170,11 +181,16 @@ class Xfoil:
             self.name = FindBetween(foil, parent, '\.')
         #CREATE SAVE DIRECTORY
             #Save in Data/airfoilname/
-        self.savepath = 'Data/{}'.format(self.name)
+        self.savepath = pathlib.Path('Data') / self.name
         MakeOutputDir(self.savepath)
+        #Surface pressure filename prefix (only alpha changes between files)
+            #(built in 'SaveNameSurfCp' for the Reynolds number in 'cpprefixRe')
+        self.cpprefix = None
+        self.cpprefixRe = None
 
         #INITIALIZE COMMAND INPUT LIST
-        self.input = ''
+            #(list of encoded lines, joined once when sent to XFOIL)
+        self.input = []
 
         #TURN OFF GRAPHICS (MAKE XFOIL "HEADLESS")
             #avoids XQuartz incompatibility
@@ -189,24 +205,35 @@ class Xfoil:
         """Add input command to command list
         cmd --> string command to add
         """
-        self.input += '{}\n'.format(cmd)
+        self.input.append('{}'.format(cmd).encode('utf-8'))
 
-    def RunXfoil(self, quiet=True):
+    def RunXfoil(self, quiet=True, session=None):
         """Once input command list has been built, run all commands with this
         quiet --> true for no XFOIL output to screen
+        session --> running 'XfoilSession' to send commands to instead of
+                    starting a new XFOIL process (do not call 'Quit' first)
         """
+        if session != None:
+            #Reuse already-running XFOIL process
+            self.xf = session.xf
+            session.Send(self.input)
+            return
+
         #Supress output if quiet option, otherwise write XFOIl output to screen
-        stdout = open(os.devnull, 'wb') if quiet else None
+        stdout = subprocess.DEVNULL if quiet else None
 
         #START XFOIL
+            #(64 KB buffer for Python's writer on the XFOIL stdin pipe)
         xf = subprocess.Popen(self.xfoilpath,
                               stdin=subprocess.PIPE,
                               stdout=stdout,
-                              stderr=None,)
+                              stderr=stdout,
+                              bufsize=65536,)
         #XFOIL SUBPROCESS
         self.xf = xf
-        #Pipe inputs into xfoil
-        res = xf.communicate( self.input.encode('utf-8') )
+        #Pipe inputs into xfoil (single joined buffer)
+        payload = b'\n'.join(self.input) + b'\n'
+        res = xf.communicate(payload)
         #Space output with a few newlines
         if not quiet:
             print('\n\n\n')
@@ -223,7 +250,10 @@ class Xfoil:
                 txt = "PYXFOIL ERROR: Geometry input file does not exist/" \
                 "in wrong location\n({})".format(self.foil)
                 sys.exit(ErrorMessage(txt))
-            if len([l for l in open(self.foil, 'r')]) < 2:
+            #count lines, stopping after the first two
+            with open(self.foil, 'r') as f:
+                nlines = sum(1 for _ in zip(range(2), f))
+            if nlines < 2:
                 txt = "PYXFOIL ERROR: Geometry input file is empty (no data)" \
                 "\nDownload or create new file: ({})".format(self.foil)
                 sys.exit(ErrorMessage(txt))
@@ -231,11 +261,18 @@ class Xfoil:
             #Load geometry from file path
             self.AddInput('load {}'.format( self.foil) )
 
-    def SaveGeom(self, overwrite=True):
+    def SaveGeom(self, overwrite=True, saved=None):
         """Save airfoil geometry. MUST BE CALLED IN TOP MENU.
         overwrite --> Overwrite file if it exists
+        saved --> set of geometry files already queued to be saved by a
+                  running XFOIL (skipped, since saving again would make XFOIL
+                  prompt to overwrite). New save files are added to the set.
         """
         savename = self.SaveNameGeom()
+        if saved != None:
+            if savename in saved:
+                return
+            saved.add(savename)
         if not os.path.isfile(savename) and overwrite:
             self.AddInput( 'save {}'.format( savename ) )
 
@@ -251,6 +288,15 @@ class Xfoil:
         #SET ITERATION NUMBER
         self.AddInput('iter {}'.format( self.Iter ))
 
+    def ResetOperMenu(self):
+        """Return 'oper' menu to inviscid mode. XFOIL's 'visc' command is a
+        toggle that persists when a new airfoil is loaded, so cases run in
+        the same XFOIL process must turn it back off. Call in 'oper' menu.
+        """
+        if self.Re != 0:
+            #TOGGLE VISCOUS MODE OFF
+            self.AddInput('visc')
+
     def SingleAlfa(self, alf, SaveCP=True):
         """Simulate airfoil at a single angle of attack.
         Must be run in 'oper' menu.
@@ -262,6 +308,15 @@ class Xfoil:
             savename = self.SaveNameSurfCp(alf)
             self.AddInput('cpwr {}'.format(savename) )
 
+    def AlfaSequence(self, alf1, alf2, dalf):
+        """Simulate airfoil over evenly-spaced angles of attack in a single
+        XFOIL command (no surface pressure output). Must be run in 'oper' menu.
+        alf1 --> first angle of attack
+        alf2 --> last angle of attack
+        dalf --> angle of attack increment
+        """
+        self.AddInput('aseq {} {} {}'.format(alf1, alf2, dalf))
+
     def Polar(self, alfs, SaveCP=True, overwrite=True):
         """Create and save polar for airfoil. Call in top menu after
         loading geometry.
@@ -271,9 +326,7 @@ class Xfoil:
         """
 
         #STORE RUN INFO
-        if type(alfs) == float or type(alfs) == int:
-            #angle of attack input must be array-like
-            alfs = [alfs]
+        alfs = _AlfaArray(alfs)
         self.alfs = alfs
         #SET REYNOLDS NUMBER
         self.EnterOperMenu()
@@ -294,20 +347,56 @@ class Xfoil:
         # self.AddInput('pacc'; savename; self.savename + 'dump.dat')
 
         #SIMULATE EACH ANGLE OF ATTACK
-        for alf in alfs:
-            self.SingleAlfa(alf, SaveCP)
+        dalfs = np.diff(alfs)
+        if not SaveCP and len(alfs) > 1 and dalfs[0] != 0 \
+                and np.allclose(dalfs, dalfs[0]):
+            #evenly spaced alphas without Cp output: let XFOIL run the sweep
+            self.AlfaSequence(alfs[0], alfs[-1], dalfs[0])
+        else:
+            for alf in alfs:
+                self.SingleAlfa(alf, SaveCP)
 
         # if len(alfs) > 1:
         #TURN POLAR ACCUMULATION OFF
         self.AddInput('pacc')
 
-    def Quit(self):
-        """Quit XFOIL by going to top-most menu and issuing 'quit' command
+    def PolarSaved(self, alfs, SaveCP=True):
+        """Return true if polar (and surface pressure) save files for given
+        alphas already exist
+        alfs --> list of alphas to check
+        SaveCP --> also check individual surface pressure distributions
+        """
+        #STORE RUN INFO (same as 'Polar', for skipped runs)
+        alfs = _AlfaArray(alfs)
+        self.alfs = alfs
+        savename = self.SaveNamePolar(alfs)
+        if not os.path.isfile(savename):
+            return False
+        if SaveCP:
+            for alf in alfs:
+                if not os.path.isfile(self.SaveNameSurfCp(alf)):
+                    return False
+        else:
+            #polar name only has first/last alpha, check each alpha is in it
+                #(XFOIL writes alpha to 3 decimal places)
+            saved = ReadXfoilPolar(savename)['alpha'].values
+            for alf in alfs:
+                if not np.any(np.isclose(saved, alf, rtol=0, atol=5e-4)):
+                    return False
+        return True
+
+    def TopMenu(self):
+        """Return to XFOIL top-most menu from any sub-menu
         """
         self.AddInput('')
         self.AddInput('')
         self.AddInput('')
         self.AddInput('')
+
+    def Quit(self):
+        """Quit XFOIL by going to top-most menu and issuing 'quit' command
+        """
+        self.TopMenu()
         self.AddInput('quit')
 
     def TurnOffGraphics(self,):
@@ -324,32 +413,101 @@ class Xfoil:
     def SaveNameGeom(self,):
         """Make save filename for airfoil geometry
         """
-        return '{}/{}.dat'.format(self.savepath, self.name)
+        return str(self.savepath / '{}.dat'.format(self.name))
 
     def SaveNameSurfCp(self, alf):
         """Make save filename for airfoil surface pressure based on current
         airfoil, Reynolds number, and angle of attack
         alf --> current angle of attack
         """
-        return '{}/{}_surfCP_Re{:1.2e}a{:1.1f}.dat'.format(
-                        self.savepath, self.name, self.Re, alf)
+        #rebuild airfoil/Reynolds number part of name only if Re has changed
+        if self.cpprefix == None or self.cpprefixRe != self.Re:
+            self.cpprefix = str(self.savepath / '{}_surfCP_Re{:1.2e}a'.format(
+                            self.name, self.Re))
+            self.cpprefixRe = self.Re
+        return '{}{:1.1f}.dat'.format(self.cpprefix, alf)
 
     def SaveNamePolar(self, alfs):
         """Make save filename for airfoil polar based on
         airfoil, Reynolds number, and angle of attack
         alfs --> Range of angles of attack to run
         """
-        if type(alfs) == float or type(alfs) == int:
-            #angle of attack input must be array-like
-            alfs = [alfs]
+        alfs = _AlfaArray(alfs)
         if len(alfs) == 1:
             #only one provided angle of attack
             alfrange = 'a{:1.2f}'.format(alfs[0])
         else:
             #use least and greatest angle of attack for name
             alfrange = 'a{:1.1f}-{:1.1f}'.format(alfs[0], alfs[-1])
-        return '{}/{}_polar_Re{:1.2e}{}.dat'.format(
-                        self.savepath, self.name, self.Re, alfrange)
+        return str(self.savepath / '{}_polar_Re{:1.2e}{}.dat'.format(
+                        self.name, self.Re, alfrange))
+
+
+
+class XfoilSession:
+    def __init__(self, xfoilpath=None, quiet=True):
+        """Start a single XFOIL process that many 'Xfoil' input lists can be
+        sent to, avoiding a new process start-up for every case.
+        Use as a context manager, or call 'Close' when finished.
+        Output files are only guaranteed to be complete after 'Close'.
+        NOTE: commands are queued without reading XFOIL's prompts back, so
+        any unexpected prompt (e.g. 'Overwrite?' when saving a file that
+        another queued case already wrote) takes the next command as its
+        answer and silently derails the rest of the input. Geometry saves
+        are tracked in 'saved' to avoid this.
+        xfoilpath --> path to xfoil executable file
+        quiet --> true for no XFOIL output to screen
+        """
+        self.xfoilpath = GetXfoilPath(xfoilpath)
+        self.quiet = quiet
+        #Geometry files queued to be saved in this session
+        self.saved = set()
+        #Supress output if quiet option, otherwise write XFOIl output to screen
+            #(output is never piped back, so XFOIL cannot block on a full pipe)
+        stdout = subprocess.DEVNULL if quiet else None
+        #START XFOIL
+        self.xf = subprocess.Popen(self.xfoilpath,
+                                   stdin=subprocess.PIPE,
+                                   stdout=stdout,
+                                   stderr=stdout,
+                                   bufsize=65536,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.Close()
+
+    def Send(self, lines):
+        """Pipe list of encoded input lines into running XFOIL process.
+        Input must finish in the XFOIL top-most menu.
+        lines --> list of encoded command lines (see 'Xfoil.input')
+        """
+        try:
+            self.xf.stdin.write(b'\n'.join(lines) + b'\n')
+            self.xf.stdin.flush()
+        except BrokenPipeError:
+            txt = "PYXFOIL ERROR: XFOIL session exited before all input was sent"
+            sys.exit(ErrorMessage(txt))
+
+    def Close(self):
+        """Quit XFOIL and wait for it to finish writing output files
+        """
+        try:
+            if self.xf.poll() == None:
+                self.xf.stdin.write(b'quit\n')
+        except BrokenPipeError:
+            #XFOIL already exited
+            pass
+        finally:
+            try:
+                self.xf.stdin.close()
+            except BrokenPipeError:
+                pass
+        self.xf.wait()
+        #Space output with a few newlines
+        if not self.quiet:
+            print('\n\n\n')
 
 
 
@@ -357,19 +515,70 @@ class Xfoil:
 ### XFOIL FILE I/O #####################################################
 ########################################################################
 
+def _CacheName(filename):
+    """Path of binary (parquet) cache file for given text data file"""
+    return filename + '.parquet'
+
+def _ReadCache(filename):
+    """Read parquet cache of text data file if it is strictly newer than
+    the text file (equal times may hide a rewrite), otherwise return None
+    filename --> path to text data file
+    """
+    cachename = _CacheName(filename)
+    if os.path.isfile(cachename) and \
+            os.path.getmtime(cachename) > os.path.getmtime(filename):
+        try:
+            return pd.read_parquet(cachename)
+        except (ImportError, OSError, ValueError):
+            #unreadable/partially written cache, fall back to text file
+            pass
+    return None
+
+def _WriteCache(filename, df):
+    """Save parquet cache of text data file next to it.
+    Best effort: skipped if no parquet engine (pyarrow/fastparquet) is
+    installed or the file cannot be written.
+    filename --> path to text data file
+    df --> data read from text data file
+    """
+    try:
+        df.to_parquet(_CacheName(filename))
+    except (ImportError, OSError):
+        pass
+
+def _LoadTable(filename, skip, names):
+    """Read whitespace-separated numeric columns into a DataFrame
+    filename --> path to file
+    skip --> number of title lines to skip
+    names --> column names
+    """
+    with warnings.catch_warnings():
+        #files with only title lines are expected, read them silently
+        warnings.filterwarnings('ignore', message='loadtxt: input contained no data')
+        data = np.loadtxt(filename, skiprows=skip, ndmin=2)
+    if data.size == 0:
+        #no data after title lines (e.g. polar where no alpha converged)
+        return pd.DataFrame(columns=names, dtype=float)
+    return pd.DataFrame(data, columns=names)
+
 def ReadXfoilAirfoilGeom(filename):
     """Read in XFOIL airfoil geometry file data, skipping title lines
     filename --> path to file
     """
-    df = pd.read_csv(filename, delim_whitespace=True, skiprows=1,
-                     names=['x', 'z'])
+    names = ['x', 'z']
+    df = _LoadTable(filename, 1, names)
     return df
 
-def ReadXfoilSurfPress(filename):
+def ReadXfoilSurfPress(filename, cache=False):
     """Read in XFOIL surface pressure coefficient data, skipping title lines
     filename --> path to file
+    cache --> reuse/save binary copy of data for faster repeated reads
     """
-    if IsItWindows():
+    if cache:
+        df = _ReadCache(filename)
+        if df is not None:
+            return df
+    if _IS_WINDOWS:
         #Windows file format
         names = ['x', 'y', 'Cp']
         skip = 3
@@ -378,31 +587,50 @@ def ReadXfoilSurfPress(filename):
         names = ['x', 'Cp']
         skip = 1
     #read file
-    df = pd.read_csv(filename, delim_whitespace=True, skiprows=skip, names=names)
+    df = _LoadTable(filename, skip, names)
+    if cache:
+        _WriteCache(filename, df)
     return df
 
-def ReadXfoilPolar(filename):
+def ReadXfoilPolar(filename, cache=False):
     """Read in XFOIL polar file data, skipping title lines
     filename --> path to polar data file
+    cache --> reuse/save binary copy of data for faster repeated reads
     """
-    df = pd.read_csv(filename, delim_whitespace=True, skiprows=12,
-            names=['alpha', 'Cl', 'Cd', 'Cdp', 'Cm', 'Top_Xtr', 'Bot_Xtr'])
+    if cache:
+        df = _ReadCache(filename)
+        if df is not None:
+            return df
+    names = ['alpha', 'Cl', 'Cd', 'Cdp', 'Cm', 'Top_Xtr', 'Bot_Xtr']
+    df = _LoadTable(filename, 12, names)
+    if cache:
+        _WriteCache(filename, df)
     return df
 
+def ConcatPolars(filenames, savename):
+    """Combine many XFOIL polar files into a single csv file, one polar at a
+    time, so all polars never have to be held in memory at once.
+    filenames --> list of paths to polar data files
+    savename --> path to combined csv file
+    """
+    with open(savename, 'w') as ofile:
+        for i, filename in enumerate(filenames):
+            #only write column names for first polar
+            ReadXfoilPolar(filename).to_csv(ofile, header=(i == 0), index=False)
+
 def WriteXfoilFile(name, x, z):
     """Write 2-column XFOIL file with fixed-width separation.
     First line is 'name'.  Works best for writting geometry.
     """
-    ofile = open(name, 'w')
-    ofile.write('foil\n')
-    for xx, zz in zip(x, z):
-        #XYZ POINTS FORMATED IN 3, 16-WIDE COLUMNS
-        #<  : left-aligned,
+    data = np.column_stack([np.asarray(x), np.asarray(z)])
+    with open(name, 'w') as ofile:
+        ofile.write('foil\n')
+        #XZ POINTS FORMATED IN 2, 14-WIDE COLUMNS (written in one call)
+        #-  : left-aligned,
         #14 : 14 spaces reserved in column,
         #.7 : 7 spaces reserved after decimal point,
         #f  : float
-        ofile.write('    {:<14.7f}{:<14.7f}\n'.format(xx, zz))
-    ofile.close()
+        np.savetxt(ofile, data, fmt='    %-14.7f%-14.7f')
 
 ########################################################################
 ### MAIN ###############################################################
@@ -410,7 +638,7 @@ def WriteXfoilFile(name, x, z):
 
 def GetPolar(foil='0012', naca=True, alfs=[0], Re=0,
                 SaveCP=True, Iter=100, pane=False,
-                overwrite=True, quiet=True):
+                overwrite=True, quiet=True, session=None):
     """For a single airfoil at a single Reynolds number,
     create a polar with given alphas.
     foil --> naca digits or path to geom file
@@ -421,25 +649,95 @@ def GetPolar(foil='0012', naca=True, alfs=[0], Re=0,
     pane --> smooth geometry before simulation (can cause instability)
     overwrite --> overwrite existing save files
     quiet --> Supress XFOIL output
+    session --> 'XfoilSession' to run in (default: start a new XFOIL process)
+                'quiet' is ignored, output is set by the session
     """
     #INITIALIZE XFOIL OBJECT
     obj = Xfoil(foil, naca, Re, Iter=Iter)
+    #SKIP XFOIL IF ALL OUTPUT FILES ALREADY EXIST
+    if not overwrite and obj.PolarSaved(alfs, SaveCP=SaveCP):
+        return obj
     #GEOMETRY
     #condition panel geometry (use for rough shapes, not on smooth shapes)
     if pane:
         obj.AddInput('pane')
     #Save geometry for later slope calculations
-    obj.SaveGeom()
+        #(only once per session, see 'XfoilSession')
+    obj.SaveGeom(saved=session.saved if session != None else None)
     #RUN AND SAVE ALL POLAR CASES
     obj.Polar(alfs, SaveCP=SaveCP, overwrite=overwrite)
-    #Quit XFOIL
-    obj.Quit()
-    #Run Input List In XFOIL
-    obj.RunXfoil(quiet=quiet)
+    if session != None:
+        #Leave XFOIL inviscid for next case, return to top menu,
+            #and send inputs to running XFOIL session
+        obj.ResetOperMenu()
+        obj.TopMenu()
+        obj.RunXfoil(session=session)
+    else:
+        #Quit XFOIL
+        obj.Quit()
+        #Run Input List In XFOIL
+        obj.RunXfoil(quiet=quiet)
 
     return obj
 
-
+def _GetPolarCase(case):
+    """Run a single 'GetPolar' case in a worker process.
+    Returns polar save filename (Xfoil object holds a process handle and
+    cannot be sent back from the worker).
+    case --> tuple of positional 'GetPolar' arguments (foil, naca, alfs, Re, ...)
+    """
+    obj = GetPolar(*case)
+    return obj.SaveNamePolar(obj.alfs)
+
+def _SaveCaseGeoms(cases):
+    """Save geometry of each airfoil shared by two or more 'GetPolar' cases,
+    one XFOIL run at a time. Cases sharing an airfoil (e.g. different Re)
+    share a geometry file, and concurrent XFOIL runs saving it would hit
+    XFOIL's overwrite prompt. Once saved, 'SaveGeom' skips the file in each
+    case. If shared cases differ in 'pane', the first case's geometry is saved.
+    cases --> list of tuples of positional 'GetPolar' arguments
+    """
+    #GROUP CASES BY GEOMETRY FILE
+    first = {}
+    count = {}
+    for case in cases:
+        #positional 'GetPolar' arguments (foil, naca, alfs, Re, SaveCP, Iter, pane)
+        naca = case[1] if len(case) > 1 else True
+        obj = Xfoil(case[0], naca)
+        savename = obj.SaveNameGeom()
+        if savename not in first:
+            pane = case[6] if len(case) > 6 else False
+            first[savename] = (obj, pane)
+        count[savename] = count.get(savename, 0) + 1
+
+    #SAVE SHARED GEOMETRY (unshared geometry is saved by its own case)
+    for savename, (obj, pane) in first.items():
+        if count[savename] < 2 or os.path.isfile(savename):
+            continue
+        #condition panel geometry same as in 'GetPolar'
+        if pane:
+            obj.AddInput('pane')
+        obj.SaveGeom()
+        obj.Quit()
+        obj.RunXfoil()
+
+def GetPolars(cases, parallel=True, nproc=None):
+    """Run 'GetPolar' for many independent airfoil/Reynolds number cases.
+    Each case is a separate XFOIL process, so cases can run concurrently.
+    cases --> list of tuples of positional 'GetPolar' arguments,
+                e.g. [('0012', True, [0, 10], 2e5), ...]
+    parallel --> run cases concurrently in a process pool (otherwise serial)
+    nproc --> number of worker processes (default: number of cpus)
+    Returns list of polar save filenames in same order as 'cases'
+    """
+    if not parallel:
+        return [_GetPolarCase(case) for case in cases]
+    if nproc is None:
+        nproc = os.cpu_count()
+    #Save geometry shared between cases before they run concurrently
+    _SaveCaseGeoms(cases)
+    with ProcessPoolExecutor(max_workers=nproc) as ex:
+        return list(ex.map(_GetPolarCase, cases))
 
 
 def main(foil, naca, alfs, Re, Iter=30):
@@ -469,8 +767,11 @@ if __name__ == "__main__":
     alfs = [0, 10]
     Re = 2e5
 
-    for foil, naca in zip(foils, nacas):
-        main(foil, naca, alfs, Re)
+    SaveCP = True
+    Iter = 30
+
+    GetPolars([(foil, naca, alfs, Re, SaveCP, Iter)
+                for foil, naca in zip(foils, nacas)])
 
 
 